@@ -1,17 +1,17 @@
-import unittest
+from inspect import isabstract
 
-from a2a.auth.user import UnauthenticatedUser
+from a2a.auth.user import UnauthenticatedUser, User
 
 
-class TestUnauthenticatedUser(unittest.TestCase):
-    def test_is_authenticated_returns_false(self):
-        user = UnauthenticatedUser()
-        self.assertFalse(user.is_authenticated)
+def test_user_is_abstract():
+    assert isabstract(User)
 
-    def test_user_name_returns_empty_string(self):
-        user = UnauthenticatedUser()
-        self.assertEqual(user.user_name, '')
 
+def test_is_authenticated_returns_false():
+    user = UnauthenticatedUser()
+    assert user.is_authenticated is False
 
-if __name__ == '__main__':
-    unittest.main()
+
+def test_user_name_returns_empty_string():
+    user = UnauthenticatedUser()
+    assert user.user_name == ''
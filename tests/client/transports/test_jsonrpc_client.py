@@ -94,11 +94,53 @@ MINIMAL_CANCELLED_TASK: dict[str, Any] = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_httpx_client() -> AsyncMock:
     return AsyncMock(spec=httpx.AsyncClient)
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_httpx_client(mock_httpx_client: AsyncMock) -> None:
+    """Clears calls and configured results left on the shared client."""
+    mock_httpx_client.reset_mock(return_value=True, side_effect=True)
+
+
+class _StubAsyncClient:
+    """Spec-less stand-in for httpx.AsyncClient exposing only `get`."""
+
+    def __init__(self) -> None:
+        self.get = AsyncMock()
+
+    def reset_mock(self, **kwargs: Any) -> None:
+        self.get.reset_mock(**kwargs)
+
+
+class _StubResponse:
+    """Spec-less stand-in for httpx.Response in resolver and transport tests.
+
+    Exposes only status_code, json and raise_for_status.
+    """
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.json = MagicMock()
+        self.raise_for_status = MagicMock()
+
+
+# Shared request object for the httpx errors raised in these tests.
+_DUMMY_REQUEST = MagicMock(spec=httpx.Request)
+
+
+def _http_status_error(
+    response: _StubResponse, message: str | None = None
+) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError(
+        message or f'Status {response.status_code}',
+        request=_DUMMY_REQUEST,
+        response=response,
+    )
+
+
 @pytest.fixture
 def mock_agent_card() -> MagicMock:
     mock = MagicMock(spec=AgentCard, url='http://agent.example.com/api')
@@ -128,9 +170,15 @@ class TestA2ACardResolver:
     FULL_AGENT_CARD_URL = f'{BASE_URL}{AGENT_CARD_PATH}'
     EXTENDED_AGENT_CARD_PATH = '/agent/authenticatedExtendedCard'
 
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def mock_httpx_client() -> _StubAsyncClient:
+        # A2ACardResolver only calls `get`, so skip building a full spec.
+        return _StubAsyncClient()
+
     @pytest.mark.asyncio
     async def test_init_parameters_stored_correctly(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
         base_url = 'http://example.com'
         custom_path = '/custom/agent-card.json'
@@ -153,7 +201,9 @@ class TestA2ACardResolver:
         )
 
     @pytest.mark.asyncio
-    async def test_init_strips_slashes(self, mock_httpx_client: AsyncMock):
+    async def test_init_strips_slashes(
+        self, mock_httpx_client: _StubAsyncClient
+    ):
         resolver = A2ACardResolver(
             httpx_client=mock_httpx_client,
             base_url='http://example.com/',
@@ -164,10 +214,9 @@ class TestA2ACardResolver:
 
     @pytest.mark.asyncio
     async def test_get_agent_card_success_public_only(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
-        mock_response = AsyncMock(spec=httpx.Response)
-        mock_response.status_code = 200
+        mock_response = _StubResponse()
         mock_response.json.return_value = AGENT_CARD.model_dump(mode='json')
         mock_httpx_client.get.return_value = mock_response
 
@@ -187,15 +236,30 @@ class TestA2ACardResolver:
         assert mock_httpx_client.get.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_get_agent_card_success_with_specified_path_for_extended_card(
-        self, mock_httpx_client: AsyncMock
+    @pytest.mark.parametrize(
+        ('relative_card_path', 'expected_suffix'),
+        [
+            (None, AGENT_CARD_PATH.lstrip('/')),
+            ('', AGENT_CARD_PATH.lstrip('/')),
+            (EXTENDED_AGENT_CARD_PATH, EXTENDED_AGENT_CARD_PATH.lstrip('/')),
+            (
+                EXTENDED_AGENT_CARD_PATH.lstrip('/'),
+                EXTENDED_AGENT_CARD_PATH.lstrip('/'),
+            ),
+            ('/', ''),
+        ],
+    )
+    async def test_get_agent_card_success_with_relative_card_path(
+        self,
+        mock_httpx_client: _StubAsyncClient,
+        relative_card_path: str | None,
+        expected_suffix: str,
     ):
-        extended_card_response = AsyncMock(spec=httpx.Response)
-        extended_card_response.status_code = 200
-        extended_card_response.json.return_value = (
-            AGENT_CARD_EXTENDED.model_dump(mode='json')
+        mock_response = _StubResponse()
+        mock_response.json.return_value = AGENT_CARD_EXTENDED.model_dump(
+            mode='json'
         )
-        mock_httpx_client.get.return_value = extended_card_response
+        mock_httpx_client.get.return_value = mock_response
 
         resolver = A2ACardResolver(
             httpx_client=mock_httpx_client,
@@ -205,26 +269,22 @@ class TestA2ACardResolver:
 
         auth_kwargs = {'headers': {'Authorization': 'Bearer test token'}}
         agent_card_result = await resolver.get_agent_card(
-            relative_card_path=self.EXTENDED_AGENT_CARD_PATH,
+            relative_card_path=relative_card_path,
             http_kwargs=auth_kwargs,
         )
 
-        expected_extended_url = (
-            f'{self.BASE_URL}/{self.EXTENDED_AGENT_CARD_PATH.lstrip("/")}'
-        )
         mock_httpx_client.get.assert_called_once_with(
-            expected_extended_url, **auth_kwargs
+            f'{self.BASE_URL}/{expected_suffix}', **auth_kwargs
         )
-        extended_card_response.raise_for_status.assert_called_once()
+        mock_response.raise_for_status.assert_called_once()
         assert isinstance(agent_card_result, AgentCard)
         assert agent_card_result == AGENT_CARD_EXTENDED
 
     @pytest.mark.asyncio
     async def test_get_agent_card_validation_error(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
-        mock_response = AsyncMock(spec=httpx.Response)
-        mock_response.status_code = 200
+        mock_response = _StubResponse()
         mock_response.json.return_value = {
             'invalid_field': 'value',
             'name': 'Test Agent',
@@ -246,15 +306,13 @@ class TestA2ACardResolver:
 
     @pytest.mark.asyncio
     async def test_get_agent_card_http_status_error(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 404
+        mock_response = _StubResponse(status_code=404)
         mock_response.text = 'Not Found'
-        http_status_error = httpx.HTTPStatusError(
-            'Not Found', request=MagicMock(), response=mock_response
+        mock_httpx_client.get.side_effect = _http_status_error(
+            mock_response, 'Not Found'
         )
-        mock_httpx_client.get.side_effect = http_status_error
 
         resolver = A2ACardResolver(
             httpx_client=mock_httpx_client,
@@ -273,12 +331,37 @@ class TestA2ACardResolver:
         assert 'Not Found' in str(exc_info.value)
         mock_httpx_client.get.assert_called_once_with(self.FULL_AGENT_CARD_URL)
 
+    @pytest.mark.asyncio
+    async def test_get_agent_card_different_status_codes(
+        self, mock_httpx_client: _StubAsyncClient
+    ):
+        resolver = A2ACardResolver(
+            httpx_client=mock_httpx_client,
+            base_url=self.BASE_URL,
+            agent_card_path=self.AGENT_CARD_PATH,
+        )
+
+        # Loop instead of parametrizing to avoid per-item fixture setup.
+        for status_code in (400, 401, 403, 500, 502):
+            mock_httpx_client.reset_mock(return_value=True, side_effect=True)
+            mock_response = _StubResponse(status_code=status_code)
+            mock_httpx_client.get.side_effect = _http_status_error(
+                mock_response
+            )
+
+            with pytest.raises(A2AClientHTTPError) as exc_info:
+                await resolver.get_agent_card()
+
+            assert exc_info.value.status_code == status_code
+            mock_httpx_client.get.assert_called_once_with(
+                self.FULL_AGENT_CARD_URL
+            )
+
     @pytest.mark.asyncio
     async def test_get_agent_card_json_decode_error(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
-        mock_response = AsyncMock(spec=httpx.Response)
-        mock_response.status_code = 200
+        mock_response = _StubResponse()
         json_error = json.JSONDecodeError('Expecting value', 'doc', 0)
         mock_response.json.side_effect = json_error
         mock_httpx_client.get.return_value = mock_response
@@ -301,9 +384,11 @@ class TestA2ACardResolver:
 
     @pytest.mark.asyncio
     async def test_get_agent_card_request_error(
-        self, mock_httpx_client: AsyncMock
+        self, mock_httpx_client: _StubAsyncClient
     ):
-        request_error = httpx.RequestError('Network issue', request=MagicMock())
+        request_error = httpx.RequestError(
+            'Network issue', request=_DUMMY_REQUEST
+        )
         mock_httpx_client.get.side_effect = request_error
 
         resolver = A2ACardResolver(
@@ -473,13 +558,11 @@ class TestJsonRpcTransport:
         client = JsonRpcTransport(
             httpx_client=mock_httpx_client, agent_card=mock_agent_card
         )
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 404
+        mock_response = _StubResponse(status_code=404)
         mock_response.text = 'Not Found'
-        http_error = httpx.HTTPStatusError(
-            'Not Found', request=MagicMock(), response=mock_response
+        mock_httpx_client.post.side_effect = _http_status_error(
+            mock_response, 'Not Found'
         )
-        mock_httpx_client.post.side_effect = http_error
 
         with pytest.raises(A2AClientHTTPError) as exc_info:
             await client._send_request({}, {})
@@ -512,7 +595,9 @@ class TestJsonRpcTransport:
         client = JsonRpcTransport(
             httpx_client=mock_httpx_client, agent_card=mock_agent_card
         )
-        request_error = httpx.RequestError('Network issue', request=MagicMock())
+        request_error = httpx.RequestError(
+            'Network issue', request=_DUMMY_REQUEST
+        )
         mock_httpx_client.post.side_effect = request_error
 
         with pytest.raises(A2AClientHTTPError) as exc_info:
@@ -731,7 +816,7 @@ class TestJsonRpcTransport:
         )
         mock_event_source = AsyncMock(spec=EventSource)
         mock_event_source.aiter_sse.side_effect = httpx.RequestError(
-            'Simulated request error', request=MagicMock()
+            'Simulated request error', request=_DUMMY_REQUEST
         )
         mock_aconnect_sse.return_value.__aenter__.return_value = (
             mock_event_source
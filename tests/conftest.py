@@ -0,0 +1,12 @@
+import pytest
+
+from pytest_asyncio import is_async_test
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Run every pytest-asyncio test on one shared session event loop rather
+    # than creating and closing a fresh loop per test.
+    session_scope_marker = pytest.mark.asyncio(loop_scope='session')
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
@@ -2080,21 +2080,36 @@ async def test_on_message_send_stream():
         ),
     )
 
+    stream = request_handler.on_message_send_stream(message_params)
+
     async def consume_stream():
         events = []
-        async for event in request_handler.on_message_send_stream(
-            message_params
-        ):
+        async for event in stream:
             events.append(event)
             if len(events) >= 3:
                 break  # Stop after a few events
 
         return events
 
-    # Consume first 3 events from the stream and measure time
-    start = time.perf_counter()
-    events = await consume_stream()
-    elapsed = time.perf_counter() - start
+    try:
+        # Consume first 3 events from the stream and measure time
+        start = time.perf_counter()
+        events = await consume_stream()
+        elapsed = time.perf_counter() - start
+    finally:
+        # Stop the long-running producer and close its queue so the background
+        # consumer started on disconnect drains and exits, even if consuming
+        # failed. Otherwise these tasks outlive the test and block teardown of
+        # a shared event loop.
+        await stream.aclose()
+        for task_id, producer_task in list(
+            request_handler._running_agents.items()
+        ):
+            producer_task.cancel()
+            await request_handler._queue_manager.close(task_id)
+        for t in list(request_handler._background_tasks):
+            with contextlib.suppress(asyncio.CancelledError):
+                await t
 
     # Assert we received events quickly
     assert len(events) == 3
@@ -0,0 +1,89 @@
+"""Tests for a2a.server.id_generator module."""
+
+import uuid
+
+from unittest.mock import patch
+
+import pytest
+
+from a2a.server.id_generator import (
+    IDGenerator,
+    IDGeneratorContext,
+    UUIDGenerator,
+)
+
+
+# UUIDGenerator ignores its context, so the contexts are shared read-only.
+_EMPTY_CTX = IDGeneratorContext()
+_POPULATED_CTX = IDGeneratorContext(
+    task_id='task_123', context_id='context_456'
+)
+
+
+@pytest.fixture(scope='module')
+def uuid_gen() -> UUIDGenerator:
+    # UUIDGenerator holds no state, so one instance serves the whole module.
+    return UUIDGenerator()
+
+
+class TestIDGeneratorContext:
+    """Tests for IDGeneratorContext."""
+
+    @pytest.mark.parametrize(
+        ('kwargs', 'expected'),
+        [
+            (
+                {'task_id': 'task_123', 'context_id': 'context_456'},
+                ('task_123', 'context_456'),
+            ),
+            ({}, (None, None)),
+            ({'task_id': 'task_123'}, ('task_123', None)),
+        ],
+        ids=['all_fields', 'no_fields', 'task_id_only'],
+    )
+    def test_context_construction(
+        self, kwargs: dict[str, str], expected: tuple[str | None, str | None]
+    ):
+        context = IDGeneratorContext(**kwargs)
+
+        assert (context.task_id, context.context_id) == expected
+
+
+class TestIDGenerator:
+    """Tests for the IDGenerator interface."""
+
+    def test_cannot_instantiate_abstract_class(self):
+        with pytest.raises(TypeError):
+            IDGenerator()  # type: ignore[abstract]
+
+
+class TestUUIDGenerator:
+    """Tests for UUIDGenerator."""
+
+    @pytest.mark.parametrize(
+        'context',
+        [_EMPTY_CTX, _POPULATED_CTX],
+        ids=['empty_context', 'populated_context'],
+    )
+    def test_generate_returns_uuid4_string(
+        self, uuid_gen: UUIDGenerator, context: IDGeneratorContext
+    ):
+        result = uuid_gen.generate(context)
+
+        assert isinstance(result, str)
+        assert uuid.UUID(result).version == 4
+
+    def test_generate_calls_uuid4(self, uuid_gen: UUIDGenerator):
+        expected = uuid.UUID('12345678-1234-4678-9234-567812345678')
+        with patch(
+            'a2a.server.id_generator.uuid.uuid4', return_value=expected
+        ) as mock_uuid4:
+            result = uuid_gen.generate(_EMPTY_CTX)
+
+        mock_uuid4.assert_called_once_with()
+        assert result == str(expected)
+
+    def test_generate_produces_unique_ids(self, uuid_gen: UUIDGenerator):
+        ids = {uuid_gen.generate(_EMPTY_CTX) for _ in range(8)}
+
+        assert len(ids) == 8
@@ -1,20 +1,17 @@
+from typing import Any
+
+import pytest
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.utils import base64url_encode
+
 from a2a.types import (
-    AgentCard,
     AgentCapabilities,
-    AgentSkill,
-)
-from a2a.types import (
     AgentCard,
-    AgentCapabilities,
-    AgentSkill,
     AgentCardSignature,
+    AgentSkill,
 )
 from a2a.utils import signing
-from typing import Any
-from jwt.utils import base64url_encode
-
-import pytest
-from cryptography.hazmat.primitives import asymmetric
 
 
 def create_key_provider(verification_key: str | bytes | dict[str, Any]):
@@ -26,8 +23,29 @@ def create_key_provider(verification_key: str | bytes | dict[str, Any]):
     return key_provider
 
 
-# Fixture for a complete sample AgentCard
-@pytest.fixture
+# Algorithms accepted by every verifier in this module
+_ALGS = ('HS256', 'HS384', 'ES256', 'RS256')
+
+
+def _verifier_for(verification_key: Any):
+    """Creates a verifier whose key provider always returns the given key."""
+    return signing.create_signature_verifier(
+        create_key_provider(verification_key), list(_ALGS)
+    )
+
+
+# Protected header shared by the symmetric signing tests
+_HS384_HEADER: signing.ProtectedHeader = {
+    'alg': 'HS384',
+    'kid': 'key1',
+    'jku': None,
+    'typ': 'JOSE',
+}
+
+
+# Fixture for a complete sample AgentCard. The signer appends to
+# `signatures` in place, so tests must sign a copy of this card.
+@pytest.fixture(scope='module')
 def sample_agent_card() -> AgentCard:
     return AgentCard(
         name='Test Agent',
@@ -53,21 +71,39 @@ def sample_agent_card() -> AgentCard:
     )
 
 
+def _generate_ec_keypair() -> tuple[
+    ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey
+]:
+    """Generates an EC key pair for ES256."""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    return private_key, private_key.public_key()
+
+
+# EC key pair for ES256, generated once per module since keygen is slow
+@pytest.fixture(scope='module')
+def ec_keypair() -> tuple[
+    ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey
+]:
+    return _generate_ec_keypair()
+
+
+# Unrelated key pair used for negative verification tests
+@pytest.fixture(scope='module')
+def ec_keypair_wrong() -> tuple[
+    ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey
+]:
+    return _generate_ec_keypair()
+
+
 def test_signer_and_verifier_symmetric(sample_agent_card: AgentCard):
     """Test the agent card signing and verification process with symmetric key encryption."""
     key = 'key12345'  # Using a simple symmetric key for HS256
     wrong_key = 'wrongkey'
 
     agent_card_signer = signing.create_agent_card_signer(
-        signing_key=key,
-        protected_header={
-            'alg': 'HS384',
-            'kid': 'key1',
-            'jku': None,
-            'typ': 'JOSE',
-        },
+        signing_key=key, protected_header=_HS384_HEADER
     )
-    signed_card = agent_card_signer(sample_agent_card)
+    signed_card = agent_card_signer(sample_agent_card.model_copy(deep=True))
 
     assert signed_card.signatures is not None
     assert len(signed_card.signatures) == 1
@@ -76,18 +112,14 @@ def test_signer_and_verifier_symmetric(sample_agent_card: AgentCard):
     assert signature.signature is not None
 
     # Verify the signature
-    verifier = signing.create_signature_verifier(
-        create_key_provider(key), ['HS256', 'HS384', 'ES256', 'RS256']
-    )
+    verifier = _verifier_for(key)
     try:
         verifier(signed_card)
     except signing.InvalidSignaturesError:
         pytest.fail('Signature verification failed with correct key')
 
     # Verify with wrong key
-    verifier_wrong_key = signing.create_signature_verifier(
-        create_key_provider(wrong_key), ['HS256', 'HS384', 'ES256', 'RS256']
-    )
+    verifier_wrong_key = _verifier_for(wrong_key)
     with pytest.raises(signing.InvalidSignaturesError):
         verifier_wrong_key(signed_card)
 
@@ -100,22 +132,23 @@ def test_signer_and_verifier_symmetric_multiple_signatures(
     encoded_header = base64url_encode(
         b'{"alg": "HS256", "kid": "old_key"}'
     ).decode('utf-8')
-    sample_agent_card.signatures = [
-        AgentCardSignature(protected=encoded_header, signature='old_signature')
-    ]
+    agent_card = sample_agent_card.model_copy(
+        update={
+            'signatures': [
+                AgentCardSignature(
+                    protected=encoded_header, signature='old_signature'
+                )
+            ]
+        },
+        deep=True,
+    )
     key = 'key12345'  # Using a simple symmetric key for HS256
     wrong_key = 'wrongkey'
 
     agent_card_signer = signing.create_agent_card_signer(
-        signing_key=key,
-        protected_header={
-            'alg': 'HS384',
-            'kid': 'key1',
-            'jku': None,
-            'typ': 'JOSE',
-        },
+        signing_key=key, protected_header=_HS384_HEADER
     )
-    signed_card = agent_card_signer(sample_agent_card)
+    signed_card = agent_card_signer(agent_card)
 
     assert signed_card.signatures is not None
     assert len(signed_card.signatures) == 2
@@ -124,32 +157,28 @@ def test_signer_and_verifier_symmetric_multiple_signatures(
     assert signature.signature is not None
 
     # Verify the signature
-    verifier = signing.create_signature_verifier(
-        create_key_provider(key), ['HS256', 'HS384', 'ES256', 'RS256']
-    )
+    verifier = _verifier_for(key)
     try:
         verifier(signed_card)
     except signing.InvalidSignaturesError:
         pytest.fail('Signature verification failed with correct key')
 
     # Verify with wrong key
-    verifier_wrong_key = signing.create_signature_verifier(
-        create_key_provider(wrong_key), ['HS256', 'HS384', 'ES256', 'RS256']
-    )
+    verifier_wrong_key = _verifier_for(wrong_key)
     with pytest.raises(signing.InvalidSignaturesError):
         verifier_wrong_key(signed_card)
 
 
-def test_signer_and_verifier_asymmetric(sample_agent_card: AgentCard):
+def test_signer_and_verifier_asymmetric(
+    sample_agent_card: AgentCard,
+    ec_keypair: tuple[ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey],
+    ec_keypair_wrong: tuple[
+        ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey
+    ],
+):
     """Test the agent card signing and verification process with an asymmetric key encryption."""
-    # Generate a dummy EC private key for ES256
-    private_key = asymmetric.ec.generate_private_key(asymmetric.ec.SECP256R1())
-    public_key = private_key.public_key()
-    # Generate another key pair for negative test
-    private_key_error = asymmetric.ec.generate_private_key(
-        asymmetric.ec.SECP256R1()
-    )
-    public_key_error = private_key_error.public_key()
+    private_key, public_key = ec_keypair
+    _, public_key_error = ec_keypair_wrong
 
     agent_card_signer = signing.create_agent_card_signer(
         signing_key=private_key,
@@ -160,7 +189,7 @@ def test_signer_and_verifier_asymmetric(sample_agent_card: AgentCard):
             'typ': 'JOSE',
         },
     )
-    signed_card = agent_card_signer(sample_agent_card)
+    signed_card = agent_card_signer(sample_agent_card.model_copy(deep=True))
 
     assert signed_card.signatures is not None
     assert len(signed_card.signatures) == 1
@@ -168,18 +197,13 @@ def test_signer_and_verifier_asymmetric(sample_agent_card: AgentCard):
     assert signature.protected is not None
     assert signature.signature is not None
 
-    verifier = signing.create_signature_verifier(
-        create_key_provider(public_key), ['HS256', 'HS384', 'ES256', 'RS256']
-    )
+    verifier = _verifier_for(public_key)
     try:
         verifier(signed_card)
     except signing.InvalidSignaturesError:
         pytest.fail('Signature verification failed with correct key')
 
     # Verify with wrong key
-    verifier_wrong_key = signing.create_signature_verifier(
-        create_key_provider(public_key_error),
-        ['HS256', 'HS384', 'ES256', 'RS256'],
-    )
+    verifier_wrong_key = _verifier_for(public_key_error)
     with pytest.raises(signing.InvalidSignaturesError):
         verifier_wrong_key(signed_card)